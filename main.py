@@ -12,8 +12,12 @@ Este programa demonstra quatro abordagens para resolver o Problema da Mochila 0/
 
 Uso:
     python main.py
+    python main.py --headless [--format jsonl|csv] [--output ARQUIVO] [--gzip]
+    python main.py --check [--cases N] [--seed S] [--tolerance X] [--update-baseline]
 """
 
+import argparse
+import os
 import sys
 import io
 
@@ -22,12 +26,103 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from src.formatter import print_welcome, print_footer
+from src.formatter import (
+    print_welcome,
+    print_footer,
+    print_differential_report,
+    print_timing_gate
+)
 from src.test_runner import run_all_tests
 from src.test_cases import ALL_TEST_CASES
+from src.exporter import ResultWriter, FORMATS
+from src.differential import (
+    DEFAULT_TOLERANCE,
+    run_differential,
+    run_regressions,
+    measure_reference_timings,
+    load_baseline,
+    save_baseline,
+    check_timing_regressions
+)
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Otimização de Portfólio - Programação Dinâmica")
+    parser.add_argument('--headless', action='store_true',
+                        help="sem saída formatada; grava resultados legíveis por máquina")
+    parser.add_argument('--format', choices=FORMATS,
+                        help="formato dos resultados no modo headless (padrão: jsonl)")
+    parser.add_argument('--output',
+                        help="arquivo de saída no modo headless (padrão: stdout)")
+    parser.add_argument('--gzip', action='store_true',
+                        help="comprime a saída do modo headless com gzip")
+    parser.add_argument('--check', action='store_true',
+                        help="verificação diferencial entre solvers + gate de performance")
+    parser.add_argument('--cases', type=int, default=1000,
+                        help="portfólios aleatórios na verificação diferencial (padrão: 1000)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="semente dos portfólios aleatórios (padrão: 0)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"fator máximo sobre a linha de base (padrão: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="grava os tempos medidos como nova linha de base "
+                             "(recusado se a verificação diferencial falhar)")
+    args = parser.parse_args(argv)
+    
+    # Combinações que seriam ignoradas em silêncio (um job em lote cairia na saída formatada)
+    if args.headless and args.check:
+        parser.error("--headless não pode ser combinado com --check")
+    if not args.headless:
+        ignored = [flag for flag, given in (('--format', args.format is not None),
+                                            ('--output', args.output is not None),
+                                            ('--gzip', args.gzip)) if given]
+        if ignored:
+            parser.error(f"{', '.join(ignored)} exige --headless")
+    
+    if args.format is None:
+        args.format = 'jsonl'
+    if args.output is None:
+        args.output = '-'
+    return args
+
+
+def run_checks(args: argparse.Namespace) -> int:
+    """
+    Executa a verificação diferencial e o gate de performance.
+    
+    Retorna:
+        Código de saída: 0 se tudo passou, 1 se houve discrepância ou regressão
+    """
+    regression_errors = run_regressions()
+    failures = run_differential(args.cases, args.seed)
+    print_differential_report(args.cases, args.seed, failures, regression_errors)
+    
+    timings = measure_reference_timings()
+    baseline = load_baseline()
+    baseline_errors = []
+    
+    if args.update_baseline:
+        if regression_errors or failures:
+            # Nunca grava tempos de solvers que acabaram de falhar na verificação
+            baseline_errors.append("linha de base NÃO atualizada: a verificação diferencial falhou")
+        else:
+            save_baseline(timings)
+            baseline = timings
+    
+    if baseline is None:
+        baseline_errors.append("linha de base ausente (perf_baseline.json); "
+                               "grave com --update-baseline")
+        regressions = baseline_errors
+        baseline = {}
+    else:
+        regressions = baseline_errors + check_timing_regressions(timings, baseline, args.tolerance)
+    print_timing_gate(timings, baseline, regressions)
+    
+    return 1 if regression_errors or failures or regressions else 0
+
+
+def main(argv=None):
     """
     Função principal de execução.
     
@@ -35,7 +130,30 @@ def main():
         1. Exibe mensagem de boas-vindas
         2. Executa todos os casos de teste
         3. Exibe rodapé
+    
+    No modo --headless, apenas executa os casos de teste e grava os
+    resultados (valores, seleções, tempos) em JSONL ou CSV.
+    
+    No modo --check, executa a verificação diferencial entre solvers e o
+    gate de performance, encerrando com código 1 em caso de falha.
     """
+    args = parse_args(argv)
+    
+    if args.check:
+        sys.exit(run_checks(args))
+    
+    if args.headless:
+        try:
+            with ResultWriter(args.output, fmt=args.format, compress=args.gzip) as writer:
+                run_all_tests(ALL_TEST_CASES, writer=writer)
+        except BrokenPipeError:
+            # Leitor fechou o pipe (ex.: "| head"): encerra sem traceback.
+            # Redireciona stdout para devnull para o flush final não falhar de novo.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(1)
+        return
+    
     # Display welcome header
     print_welcome()
     
@@ -71,7 +71,8 @@ def recursive_portfolio(projects: List[Project], capacity: int, index: int = 0)
     
     Casos Base:
         - Se index >= len(projects): sem mais projetos a considerar, retorna 0
-        - Se capacity == 0: sem capacidade restante, retorna 0
+        - Se capacity == 0: sem capacidade restante, só projetos de 0 horas
+          ainda cabem; retorna a soma dos seus valores positivos
         - Se hours[index] > capacity: projeto não cabe, pula ele
     
     Args:
@@ -89,9 +90,9 @@ def recursive_portfolio(projects: List[Project], capacity: int, index: int = 0)
     if index >= len(projects):
         return 0
     
-    # Caso base: sem capacidade restante
+    # Caso base: sem capacidade restante (apenas projetos de 0 horas ainda cabem)
     if capacity == 0:
-        return 0
+        return sum(p.value for p in projects[index:] if p.hours == 0 and p.value > 0)
     
     current_project = projects[index]
     
@@ -143,15 +144,22 @@ def memoization_portfolio(projects: List[Project], capacity: int) -> Tuple[int,
     """
     memo: Dict[Tuple[int, int], int] = {}
     
+    # zero_hour_suffix[i] = soma dos valores positivos dos projetos de 0 horas a partir de i
+    zero_hour_suffix = [0] * (len(projects) + 1)
+    for i in range(len(projects) - 1, -1, -1):
+        project = projects[i]
+        gain = project.value if project.hours == 0 and project.value > 0 else 0
+        zero_hour_suffix[i] = zero_hour_suffix[i + 1] + gain
+    
     def _memoized_helper(index: int, remaining_capacity: int) -> int:
         """Função auxiliar recursiva com memoização."""
         # Caso base: sem mais projetos
         if index >= len(projects):
             return 0
         
-        # Caso base: sem capacidade
+        # Caso base: sem capacidade (apenas projetos de 0 horas ainda cabem)
         if remaining_capacity == 0:
-            return 0
+            return zero_hour_suffix[index]
         
         # Verifica memo antes de computar
         state = (index, remaining_capacity)
@@ -255,7 +263,8 @@ def dynamic_programming_portfolio(projects: List[Project], capacity: int) -> Tup
     i = n
     c = capacity
     
-    while i > 0 and c > 0:
+    # Continua mesmo com c == 0: projetos de 0 horas ainda podem ter sido incluídos
+    while i > 0:
         # Se valor veio de incluir projeto i, será diferente da linha acima
         if T[i][c] != T[i - 1][c]:
             # Projeto i foi incluído
@@ -0,0 +1,138 @@
+"""
+PD com Bitset (Caso Soma de Subconjuntos)
+==========================================
+Caminho rápido para portfólios em que valor == horas (maximizar utilização).
+
+Neste caso a Mochila 0/1 se reduz à Soma de Subconjuntos: basta saber quais
+totais de horas são alcançáveis. Um inteiro Python de precisão arbitrária
+funciona como bitset — o bit c está ligado se o total c é alcançável — e cada
+projeto é processado com uma única operação sobre o inteiro inteiro:
+
+    alcancaveis |= (alcancaveis << horas) & mascara
+
+Isso substitui o laço célula a célula em Python por operações em C sobre
+palavras de máquina.
+"""
+
+from typing import List, Tuple
+from src.models import Project
+from src.algorithms import dynamic_programming_portfolio
+
+
+def is_subset_sum_portfolio(projects: List[Project]) -> bool:
+    """
+    Detecta se o portfólio é um caso de Soma de Subconjuntos (valor == horas).
+
+    Args:
+        projects: Lista de projetos disponíveis
+
+    Retorna:
+        True se todo projeto tem valor igual às horas (e horas não negativas)
+    """
+    return all(p.value == p.hours and p.hours >= 0 for p in projects)
+
+
+def reachable_hours_bitset(projects: List[Project], capacity: int) -> int:
+    """
+    Calcula todos os totais de horas alcançáveis até a capacidade.
+
+    Args:
+        projects: Lista de projetos disponíveis
+        capacity: Máximo de horas de especialista disponíveis
+
+    Retorna:
+        Inteiro usado como bitset: o bit c está ligado se algum subconjunto de
+        projetos soma exatamente c horas (0 <= c <= capacidade)
+
+    Complexidade de Tempo: O(n * capacidade / w) - w = bits por palavra de máquina
+    Complexidade de Espaço: O(capacidade / w)
+    """
+    if capacity < 0:
+        return 0
+
+    mask = (1 << (capacity + 1)) - 1
+    reach = 1  # Total 0 sempre alcançável (nenhum projeto)
+    for project in projects:
+        if 0 < project.hours <= capacity:
+            reach |= (reach << project.hours) & mask
+    return reach
+
+
+def bitset_portfolio(projects: List[Project], capacity: int) -> Tuple[int, List[str]]:
+    """
+    Mochila 0/1 via bitset quando valor == horas; senão usa PD Bottom-Up.
+
+    Algoritmo:
+        1. Se o portfólio não é Soma de Subconjuntos, delega para
+           `dynamic_programming_portfolio`
+        2. Ignora projetos que nunca entram (horas == 0 ou horas > capacidade)
+           e limita a máscara a min(capacidade, soma das horas)
+        3. Propaga o bitset de totais alcançáveis projeto a projeto, guardando
+           um checkpoint do bitset a cada ~sqrt(n) projetos
+        4. Valor ótimo = maior total alcançável (bit mais alto ligado)
+        5. Retrocesso bloco a bloco, do último ao primeiro: recalcula os
+           snapshots do bloco a partir do seu checkpoint; se o total atual já
+           era alcançável sem o projeto i, ele não é necessário; caso contrário,
+           o projeto i foi incluído e o total é reduzido de suas horas
+
+    Args:
+        projects: Lista de projetos disponíveis
+        capacity: Máximo de horas de especialista disponíveis
+
+    Retorna:
+        Tupla de (valor_ótimo, nomes_projetos_selecionados)
+
+    Complexidade de Tempo: O(n * capacidade / w) - w = bits por palavra de máquina
+        (cada bloco é propagado duas vezes)
+    Complexidade de Espaço: O(sqrt(n) * capacidade / w) - checkpoints + snapshots de um bloco
+    """
+    if not is_subset_sum_portfolio(projects):
+        return dynamic_programming_portfolio(projects, capacity)
+
+    # Projetos com horas == 0 ou acima da capacidade nunca mudam o bitset
+    relevant = [p for p in projects if 0 < p.hours <= capacity]
+    if not relevant:
+        return 0, []
+
+    limit = min(capacity, sum(p.hours for p in relevant))
+    mask = (1 << (limit + 1)) - 1
+    m = len(relevant)
+    block = max(1, int(m ** 0.5))
+
+    # checkpoints[b] = totais alcançáveis com os projetos anteriores ao bloco b
+    checkpoints = []
+    reach = 1
+    for j, project in enumerate(relevant):
+        if j % block == 0:
+            checkpoints.append(reach)
+        reach |= (reach << project.hours) & mask
+
+    # Valor ótimo é o maior total alcançável
+    optimal_value = reach.bit_length() - 1
+
+    # Retroage bloco a bloco, recalculando os snapshots a partir do checkpoint
+    selected_projects = []
+    total = optimal_value
+    for b in range(len(checkpoints) - 1, -1, -1):
+        if total == 0:
+            break
+        start = b * block
+        end = min(start + block, m)
+
+        snapshots = []  # snapshots[k] = totais alcançáveis sem os projetos start+k..m-1
+        reach = checkpoints[b]
+        for j in range(start, end):
+            snapshots.append(reach)
+            reach |= (reach << relevant[j].hours) & mask
+
+        for j in range(end - 1, start - 1, -1):
+            if total == 0:
+                break
+            if not (snapshots[j - start] >> total) & 1:
+                # Total não era alcançável sem o projeto j: ele foi incluído
+                selected_projects.append(relevant[j].name)
+                total -= relevant[j].hours
+
+    selected_projects.reverse()  # Retroação dá ordem inversa
+
+    return optimal_value, selected_projects
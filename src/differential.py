@@ -0,0 +1,523 @@
+"""
+Verificação Diferencial e Gate de Performance
+==============================================
+Garante que os solvers exatos concordam entre si e que nenhum ficou mais lento.
+
+1. Teste diferencial baseado em propriedades:
+   - Gera portfólios aleatórios (reprodutíveis por semente)
+   - Verifica que todos os solvers exatos obtêm o mesmo valor
+   - Verifica que cada seleção retornada é viável e soma o valor informado
+   - Verifica que a gulosa é viável e nunca supera o ótimo
+   - Reduz (shrink) entradas que falham ao menor contraexemplo encontrado
+
+2. Gate de regressão de tempo:
+   - Mede cada solver em entradas de referência fixas, normalizando pelo
+     tempo de um laço de calibração executado na mesma máquina
+   - Compara com a linha de base gravada em `perf_baseline.json`
+   - Falha quando um solver fica mais lento que linha_base * tolerância
+"""
+
+import itertools
+import json
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.models import Project
+from src.algorithms import (
+    greedy_portfolio,
+    recursive_portfolio,
+    memoization_portfolio,
+    dynamic_programming_portfolio
+)
+from src.bitset_dp import bitset_portfolio
+from src.multiple_knapsack import multiple_knapsack_portfolio
+from src.parallel_dp import parallel_dynamic_programming_portfolio
+
+
+# Acima disso a recursão pura fica lenta demais para o teste diferencial
+MAX_RECURSIVE_PROJECTS = 12
+
+# Acima disso a força bruta multi-equipe ((m+1)^n atribuições) fica lenta demais
+MAX_BRUTE_FORCE_PROJECTS = 7
+
+# Workers da PD paralela no teste diferencial (caminho paralelo forçado)
+PARALLEL_CHECK_WORKERS = 3
+
+# Linha de base de tempos (na raiz do repositório)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'perf_baseline.json')
+
+# Chave da linha de base no arquivo: tempos em unidades de calibração
+BASELINE_KEY = 'normalized_timings'
+
+# Fator máximo aceito sobre a linha de base antes de acusar regressão
+DEFAULT_TOLERANCE = 2.0
+
+# Tamanho do laço de calibração (~0,1 s em uma máquina típica)
+CALIBRATION_WIDTH = 20_000
+CALIBRATION_ROUNDS = 75
+
+
+# ===== TESTE DIFERENCIAL =====
+
+def random_portfolio(rng: random.Random, max_projects: int = 10,
+                     max_value: int = 30, max_hours: int = 15) -> Tuple[List[Project], int]:
+    """
+    Gera um portfólio aleatório e uma capacidade.
+
+    Cerca de 1/3 dos portfólios tem valor == horas, para exercitar o
+    caminho rápido com bitset. Também gera casos de borda válidos para a PD:
+    projetos com 0 horas (~1 em 8) e, fora dos casos valor == horas, valores
+    negativos ou nulos.
+
+    Args:
+        rng: Gerador de números aleatórios (controla a reprodutibilidade)
+        max_projects: Número máximo de projetos
+        max_value: Valor máximo de cada projeto (o mínimo é -max_value // 3)
+        max_hours: Horas máximas de cada projeto
+
+    Retorna:
+        Tupla de (projetos, capacidade)
+    """
+    n = rng.randint(0, max_projects)
+    subset_sum = rng.random() < 1 / 3
+    projects = []
+    for i in range(n):
+        hours = 0 if rng.random() < 1 / 8 else rng.randint(1, max_hours)
+        value = hours if subset_sum else rng.randint(-(max_value // 3), max_value)
+        projects.append(Project(name=f'P{i}', value=value, hours=hours))
+    capacity = rng.randint(0, max_hours * max(n, 1) // 2 + 1)
+    return projects, capacity
+
+
+def _selection_errors(solver: str, projects: List[Project], capacity: int,
+                      value: int, selected: List[str]) -> List[str]:
+    """Verifica se uma seleção é viável e soma o valor informado."""
+    by_name = {p.name: p for p in projects}
+    errors = []
+
+    if len(set(selected)) != len(selected):
+        errors.append(f"{solver}: projeto repetido na seleção {selected}")
+    unknown = [name for name in selected if name not in by_name]
+    if unknown:
+        errors.append(f"{solver}: projetos inexistentes na seleção {unknown}")
+        return errors
+
+    hours = sum(by_name[name].hours for name in selected)
+    total = sum(by_name[name].value for name in selected)
+    if hours > capacity:
+        errors.append(f"{solver}: seleção usa {hours} horas, capacidade é {capacity}")
+    if total != value:
+        errors.append(f"{solver}: seleção soma {total}, valor informado é {value}")
+    return errors
+
+
+def _team_capacities(capacity: int) -> List[List[int]]:
+    """
+    Divide uma capacidade em configurações de equipes para o teste multi-equipe.
+
+    Inclui divisões com capacidades iguais, para exercitar a quebra de simetria.
+    """
+    half = capacity // 2
+    third = capacity // 3
+    return [
+        [half, half],
+        [half, capacity - half],
+        [third, third, capacity - 2 * third],
+        [third, capacity - third],
+    ]
+
+
+def _brute_force_multi_team(projects: List[Project], capacities: List[int]) -> int:
+    """Valor ótimo da mochila múltipla testando todas as (m+1)^n atribuições."""
+    best = 0
+    for assignment in itertools.product(range(-1, len(capacities)), repeat=len(projects)):
+        load = [0] * len(capacities)
+        value = 0
+        for project, team in zip(projects, assignment):
+            if team != -1:
+                load[team] += project.hours
+                value += project.value
+        if value > best and all(used <= cap for used, cap in zip(load, capacities)):
+            best = value
+    return best
+
+
+def _multi_team_errors(projects: List[Project], capacities: List[int]) -> List[str]:
+    """Verifica a mochila múltipla contra a força bruta e a viabilidade por equipe."""
+    errors = []
+    label = f"multiple_knapsack{capacities}"
+    value, selections = multiple_knapsack_portfolio(projects, capacities)
+
+    if len(selections) != len(capacities):
+        return [f"{label}: {len(selections)} seleções para {len(capacities)} equipes"]
+
+    by_name = {p.name: p for p in projects}
+    for team, (selected, cap) in enumerate(zip(selections, capacities)):
+        team_value = sum(by_name[name].value for name in selected if name in by_name)
+        errors += _selection_errors(f"{label}[equipe {team}]", projects, cap, team_value, selected)
+
+    assigned = [name for selected in selections for name in selected]
+    if len(set(assigned)) != len(assigned):
+        errors.append(f"{label}: projeto atribuído a mais de uma equipe {selections}")
+    total = sum(by_name[name].value for name in assigned if name in by_name)
+    if total != value:
+        errors.append(f"{label}: seleções somam {total}, valor informado é {value}")
+
+    expected = _brute_force_multi_team(projects, capacities)
+    if value != expected:
+        errors.append(f"{label}: valor {value}, força bruta {expected}")
+    return errors
+
+
+def check_portfolio(projects: List[Project], capacity: int) -> List[str]:
+    """
+    Executa todos os solvers em um portfólio e verifica as propriedades.
+
+    Propriedades:
+        - Solvers exatos (recursiva, memoização, DP, bitset, PD paralela com
+          caminho paralelo forçado, mochila múltipla com uma equipe) obtêm o
+          mesmo valor
+        - Seleções retornadas são viáveis e somam o valor informado
+        - Gulosa é viável e nunca supera o valor ótimo
+        - Mochila múltipla com várias equipes (capacidade dividida, n pequeno)
+          coincide com a força bruta e cada equipe respeita sua capacidade
+
+    Args:
+        projects: Lista de projetos
+        capacity: Capacidade de horas
+
+    Retorna:
+        Lista de discrepâncias encontradas (vazia se tudo concorda)
+    """
+    errors = []
+
+    dp_value, dp_selected = dynamic_programming_portfolio(projects, capacity)
+    bitset_value, bitset_selected = bitset_portfolio(projects, capacity)
+    parallel_value, parallel_selected = parallel_dynamic_programming_portfolio(
+        projects, capacity, workers=PARALLEL_CHECK_WORKERS, min_cells=1)
+    multi_value, multi_selected = multiple_knapsack_portfolio(projects, [capacity])
+    memo_value, _ = memoization_portfolio(projects, capacity)
+
+    exact_values = {
+        'dp': dp_value,
+        'bitset': bitset_value,
+        'parallel_dp': parallel_value,
+        'multiple_knapsack': multi_value,
+        'memoization': memo_value,
+    }
+    if len(projects) <= MAX_RECURSIVE_PROJECTS:
+        exact_values['recursive'] = recursive_portfolio(projects, capacity)
+
+    if len(set(exact_values.values())) > 1:
+        errors.append(f"valores divergentes entre solvers exatos: {exact_values}")
+
+    errors += _selection_errors('dp', projects, capacity, dp_value, dp_selected)
+    errors += _selection_errors('bitset', projects, capacity, bitset_value, bitset_selected)
+    errors += _selection_errors('parallel_dp', projects, capacity,
+                                parallel_value, parallel_selected)
+    errors += _selection_errors('multiple_knapsack', projects, capacity,
+                                multi_value, multi_selected[0])
+
+    greedy_value, greedy_selected = greedy_portfolio(projects, capacity)
+    errors += _selection_errors('greedy', projects, capacity, greedy_value, greedy_selected)
+    if greedy_value > dp_value:
+        errors.append(f"greedy: valor {greedy_value} supera o ótimo {dp_value}")
+
+    if len(projects) <= MAX_BRUTE_FORCE_PROJECTS:
+        for capacities in _team_capacities(capacity):
+            errors += _multi_team_errors(projects, capacities)
+
+    return errors
+
+
+def _shrink_candidates(projects: List[Project], capacity: int):
+    """Gera variações menores de um portfólio (remoções e reduções de números)."""
+    # Remove um projeto
+    for i in range(len(projects)):
+        yield projects[:i] + projects[i + 1:], capacity
+
+    # Reduz a capacidade
+    for smaller in (0, capacity // 2, capacity - 1):
+        if 0 <= smaller < capacity:
+            yield projects, smaller
+
+    # Aproxima o valor de zero e reduz as horas de cada projeto
+    for i, p in enumerate(projects):
+        for value in (0, int(p.value / 2), p.value - 1 if p.value > 0 else p.value + 1):
+            if abs(value) < abs(p.value):
+                yield projects[:i] + [Project(p.name, value, p.hours)] + projects[i + 1:], capacity
+        for hours in (0, p.hours // 2, p.hours - 1):
+            if 0 <= hours < p.hours:
+                yield projects[:i] + [Project(p.name, p.value, hours)] + projects[i + 1:], capacity
+
+
+def shrink_portfolio(projects: List[Project], capacity: int,
+                     check: Callable[[List[Project], int], List[str]] = check_portfolio
+                     ) -> Tuple[List[Project], int]:
+    """
+    Reduz uma entrada que falha até um contraexemplo mínimo local.
+
+    Algoritmo:
+        Repete enquanto houver progresso: tenta cada variação menor
+        (remover projeto, reduzir capacidade, reduzir valor/horas) e aceita a
+        primeira que continua falhando.
+
+    Args:
+        projects: Projetos da entrada que falha
+        capacity: Capacidade da entrada que falha
+        check: Função de verificação (retorna lista de discrepâncias)
+
+    Retorna:
+        Tupla de (projetos, capacidade) do menor contraexemplo encontrado
+    """
+    progress = True
+    while progress:
+        progress = False
+        for candidate, candidate_capacity in _shrink_candidates(projects, capacity):
+            if check(candidate, candidate_capacity):
+                projects, capacity = candidate, candidate_capacity
+                progress = True
+                break
+    return projects, capacity
+
+
+# ===== CASOS DE REGRESSÃO =====
+
+def _regression_deep_multiple_knapsack() -> List[str]:
+    """
+    Mochila múltipla com 1500 projetos de 6 horas e equipes [10, 10].
+
+    Antes, a busca recursiva estourava a pilha (RecursionError), pois o
+    limitante fundido contava 4 + 4 horas livres como espaço para mais um projeto.
+    """
+    projects = [Project(name=f'P{i}', value=6, hours=6) for i in range(1500)]
+    try:
+        value, selections = multiple_knapsack_portfolio(projects, [10, 10], time_limit=5)
+    except RecursionError:
+        return ["multiple_knapsack: RecursionError com 1500 projetos"]
+
+    errors = []
+    if value != 12:
+        errors.append(f"multiple_knapsack: valor {value} com 1500 projetos, esperado 12")
+    for team, selected in enumerate(selections):
+        errors += _selection_errors(f'multiple_knapsack[equipe {team}]', projects, 10,
+                                    6 * len(selected), selected)
+    return errors
+
+
+def _regression_negative_value_multiple_knapsack() -> List[str]:
+    """
+    Mochila múltipla com projetos de valor negativo (inclusive com 0 horas).
+
+    Antes, a heurística inicial alocava esses projetos e a relaxação linear
+    somava seus valores, ficando abaixo do ótimo e podando o ramo ótimo.
+    """
+    cases = [
+        ([Project('A', 10, 1), Project('N', -5, 1)], [3_000_000], 10),
+        ([Project('A', 10, 1), Project('Z', -3, 0), Project('B', 7, 2)], [2, 1], 17),
+    ]
+    errors = []
+    for projects, capacities, expected in cases:
+        value, selections = multiple_knapsack_portfolio(projects, capacities)
+        if value != expected:
+            errors.append(f"multiple_knapsack{capacities}: valor {value} com valores "
+                          f"negativos, esperado {expected}")
+        errors += _multi_team_errors(projects, capacities)
+    return errors
+
+
+REGRESSION_CHECKS: List[Callable[[], List[str]]] = [
+    _regression_deep_multiple_knapsack,
+    _regression_negative_value_multiple_knapsack,
+]
+
+
+def run_regressions() -> List[str]:
+    """
+    Executa os casos fixos de regressão.
+
+    Retorna:
+        Lista de discrepâncias encontradas (vazia se todos passam)
+    """
+    errors = []
+    for check in REGRESSION_CHECKS:
+        errors += check()
+    return errors
+
+
+def run_differential(num_cases: int = 500, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Executa o teste diferencial em portfólios aleatórios.
+
+    Args:
+        num_cases: Número de portfólios gerados
+        seed: Semente do gerador (mesma semente = mesmos portfólios)
+
+    Retorna:
+        Lista de falhas; cada uma com 'case', 'capacity', 'projects'
+        (já reduzidos) e 'errors'
+    """
+    rng = random.Random(seed)
+    failures = []
+
+    for case in range(num_cases):
+        projects, capacity = random_portfolio(rng)
+        if not check_portfolio(projects, capacity):
+            continue
+        projects, capacity = shrink_portfolio(projects, capacity)
+        failures.append({
+            'case': case,
+            'capacity': capacity,
+            'projects': projects,
+            'errors': check_portfolio(projects, capacity),
+        })
+
+    return failures
+
+
+# ===== GATE DE REGRESSÃO DE TEMPO =====
+
+def _reference_projects(seed: int, n: int, max_value: int, max_hours: int,
+                        subset_sum: bool = False) -> List[Project]:
+    """Gera um portfólio de referência determinístico."""
+    rng = random.Random(seed)
+    projects = []
+    for i in range(n):
+        hours = rng.randint(1, max_hours)
+        value = hours if subset_sum else rng.randint(1, max_value)
+        projects.append(Project(name=f'R{i}', value=value, hours=hours))
+    return projects
+
+
+def reference_benchmarks() -> Dict[str, Callable[[], Any]]:
+    """
+    Entradas de referência fixas para cada solver.
+
+    Dimensionadas para levar bem mais de 100 ms cada, reduzindo o peso do
+    ruído do sistema na medição.
+
+    Retorna:
+        Dicionário nome_solver -> função sem argumentos que executa o solver
+    """
+    medium = _reference_projects(seed=1, n=150, max_value=100, max_hours=80)
+    small = _reference_projects(seed=2, n=20, max_value=50, max_hours=20)
+    subset_sum = _reference_projects(seed=3, n=4000, max_value=0, max_hours=500, subset_sum=True)
+    many = _reference_projects(seed=4, n=400000, max_value=100, max_hours=50)
+    # Instâncias em que o branch-and-bound precisa de busca real (mas termina)
+    team_batches = [_reference_projects(seed=seed, n=40, max_value=60, max_hours=30)
+                    for seed in (100, 101, 109, 116)]
+    wide = _reference_projects(seed=6, n=10, max_value=1000, max_hours=20000)
+
+    return {
+        'greedy': lambda: greedy_portfolio(many, 1000000),
+        'recursive': lambda: recursive_portfolio(small, 160),
+        'memoization': lambda: memoization_portfolio(medium, 3000),
+        'dp': lambda: dynamic_programming_portfolio(medium, 4000),
+        'bitset': lambda: bitset_portfolio(subset_sum, 1000000),
+        'multiple_knapsack': lambda: [multiple_knapsack_portfolio(teams, [57, 61, 67, 71])
+                                      for teams in team_batches],
+        'parallel_dp': lambda: parallel_dynamic_programming_portfolio(wide, 100000, workers=2),
+    }
+
+
+def _calibration_loop() -> None:
+    """
+    Laço de calibração em Python puro (mesmo perfil do laço interno da PD).
+
+    Executado na mesma máquina e no mesmo momento que cada solver: dividir o
+    tempo do solver pelo tempo deste laço cancela a velocidade da máquina.
+    """
+    width = CALIBRATION_WIDTH
+    prev = [i % 97 for i in range(width)]
+    cur = [0] * width
+    for h in range(1, CALIBRATION_ROUNDS + 1):
+        for c in range(h, width):
+            exclude_value = prev[c]
+            include_value = h + prev[c - h]
+            cur[c] = include_value if include_value > exclude_value else exclude_value
+        prev, cur = cur, prev
+
+
+def measure_reference_timings(repeats: int = 3) -> Dict[str, float]:
+    """
+    Mede cada solver nas entradas de referência, normalizado pela calibração.
+
+    Em cada repetição, o laço de calibração roda imediatamente antes do
+    solver; o resultado é a menor razão tempo_solver / tempo_calibração entre
+    as repetições (menos sensível a ruído e independente da máquina).
+
+    Args:
+        repeats: Número de execuções por solver
+
+    Retorna:
+        Dicionário nome_solver -> tempo em unidades de calibração
+    """
+    timings = {}
+    for solver, run in reference_benchmarks().items():
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _calibration_loop()
+            calibration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            run()
+            best = min(best, (time.perf_counter() - start) / calibration)
+        timings[solver] = best
+    return timings
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict[str, float]]:
+    """
+    Lê a linha de base de tempos normalizados.
+
+    Retorna:
+        Dicionário nome_solver -> unidades de calibração, ou None se o arquivo não existe
+
+    Raises:
+        ValueError: Se o arquivo não está no formato normalizado
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if BASELINE_KEY not in data:
+        raise ValueError(f"Linha de base em formato antigo: {path} (regrave com --update-baseline)")
+    return data[BASELINE_KEY]
+
+
+def save_baseline(timings: Dict[str, float], path: str = BASELINE_PATH) -> None:
+    """Grava a linha de base de tempos normalizados."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({BASELINE_KEY: timings}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def check_timing_regressions(timings: Dict[str, float], baseline: Dict[str, float],
+                             tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Compara tempos normalizados medidos com a linha de base.
+
+    Args:
+        timings: Tempos medidos (nome_solver -> unidades de calibração)
+        baseline: Tempos de referência (nome_solver -> unidades de calibração)
+        tolerance: Fator máximo aceito (ex.: 2.0 = até 2x mais lento)
+
+    Retorna:
+        Lista de regressões encontradas (vazia se nenhuma); solvers sem
+        linha de base também contam como falha
+    """
+    regressions = []
+    for solver, units in timings.items():
+        if solver not in baseline:
+            regressions.append(f"{solver}: sem linha de base (regrave com --update-baseline)")
+            continue
+        limit = baseline[solver] * tolerance
+        if units > limit:
+            regressions.append(
+                f"{solver}: {units:.2f} > {limit:.2f} "
+                f"(linha de base {baseline[solver]:.2f} x {tolerance})"
+            )
+    return regressions
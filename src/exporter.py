@@ -0,0 +1,104 @@
+"""
+Exportação de Resultados (Modo Headless)
+=========================================
+Grava resultados dos casos de teste em formato legível por máquina
+(JSONL ou CSV), opcionalmente comprimidos com gzip, sem saída formatada
+no console.
+"""
+
+import csv
+import gzip
+import io
+import json
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+
+# Colunas do CSV, na ordem em que são gravadas
+CSV_FIELDS = [
+    'case_num', 'name', 'capacity', 'num_projects',
+    'greedy', 'greedy_projects', 'greedy_seconds',
+    'recursive', 'recursive_seconds',
+    'memoization', 'memo_size', 'memoization_seconds',
+    'dp', 'dp_projects', 'dp_seconds', 'dp_engine',
+]
+
+# Buffer de escrita: evita uma chamada de sistema por registro
+BUFFER_SIZE = 1 << 20
+
+FORMATS = ('jsonl', 'csv')
+
+
+def _open_stream(path: Optional[str], compress: bool) -> TextIO:
+    """
+    Abre o destino da exportação como stream de texto com buffer.
+
+    Args:
+        path: Caminho do arquivo, ou None / "-" para stdout
+        compress: Se True, comprime a saída com gzip
+
+    Retorna:
+        Stream de texto UTF-8 pronto para escrita
+    """
+    if path is None or path == '-':
+        if compress:
+            binary = gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb')
+            return io.TextIOWrapper(binary, encoding='utf-8', newline='')
+        return sys.stdout
+
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+
+
+class ResultWriter:
+    """
+    Grava registros de resultados em JSONL ou CSV.
+
+    Uso:
+        with ResultWriter('resultados.jsonl.gz', fmt='jsonl', compress=True) as writer:
+            writer.write(registro)
+    """
+
+    def __init__(self, path: Optional[str] = None, fmt: str = 'jsonl', compress: bool = False):
+        """
+        Args:
+            path: Caminho do arquivo, ou None / "-" para stdout
+            fmt: Formato de saída ("jsonl" ou "csv")
+            compress: Se True, comprime a saída com gzip
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato inválido: {fmt!r} (use {' ou '.join(FORMATS)})")
+
+        self.fmt = fmt
+        self._stream = _open_stream(path, compress)
+        self._owns_stream = self._stream is not sys.stdout
+        self._csv = None
+        if fmt == 'csv':
+            self._csv = csv.DictWriter(self._stream, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Grava um registro de resultado."""
+        if self._csv is not None:
+            row = dict(record)
+            # Listas de projetos viram uma única coluna separada por ";"
+            for key in ('greedy_projects', 'dp_projects'):
+                if key in row:
+                    row[key] = ';'.join(row[key])
+            self._csv.writerow(row)
+        else:
+            self._stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def close(self) -> None:
+        """Descarrega o buffer e fecha o destino (stdout é apenas descarregado)."""
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -5,7 +5,7 @@ Toda a lógica de exibição e formatação para saída em Português-BR.
 Usa caracteres Unicode box-drawing e ícones emoji.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from src.models import Project
 
 
@@ -102,7 +102,8 @@ def print_comparison_section(greedy_value: int, recursive_value: int,
         rec_status = "✓ Ótimo" if recursive_value == dp_value else "❌ Erro"
         print_result("Recursiva", f"Valor = {recursive_value}", f"({rec_status})", indent=2, marker="├─")
     
-    print_result("Memoização", f"Valor = {memo_value}", "(✓ Ótimo)", indent=2, marker="├─")
+    memo_status = "✓ Ótimo" if memo_value == dp_value else "❌ Erro"
+    print_result("Memoização", f"Valor = {memo_value}", f"({memo_status})", indent=2, marker="├─")
     print_result("DP Bottom-Up", f"Valor = {dp_value}", "(✓ Ótimo) ⭐", indent=2, marker="└─")
 
 
@@ -158,6 +159,53 @@ def print_execution_stats(total_tests: int, greedy_failures: int) -> None:
     print(f"  • Taxa de sucesso DP: 100% (solução ótima sempre encontrada)")
 
 
+def print_differential_report(num_cases: int, seed: int, failures: List[Dict[str, Any]],
+                              regression_errors: Optional[List[str]] = None) -> None:
+    """Imprime resultado do teste diferencial entre solvers."""
+    print_header("VERIFICAÇÃO DIFERENCIAL ENTRE SOLVERS")
+    
+    if regression_errors:
+        print("\n❌ Casos de regressão falharam:")
+        for error in regression_errors:
+            print(f"    ⚠️  {error}")
+    else:
+        print("\n✅ Casos de regressão: todos passaram")
+    
+    print(f"\n📊 Portfólios aleatórios: {num_cases} (semente {seed})")
+    
+    if not failures:
+        print("\n✅ Todos os solvers exatos concordam e todas as seleções são viáveis!")
+        return
+    
+    print(f"\n❌ {len(failures)} portfólio(s) com discrepância:")
+    for failure in failures:
+        print(f"\n  • Caso {failure['case']} (reduzido): capacidade = {failure['capacity']}")
+        for p in failure['projects']:
+            print(f"    - {p.name}: Valor={p.value}, Horas={p.hours}")
+        for error in failure['errors']:
+            print(f"    ⚠️  {error}")
+
+
+def print_timing_gate(timings: Dict[str, float], baseline: Dict[str, float],
+                      regressions: List[str]) -> None:
+    """Imprime comparação dos tempos medidos com a linha de base."""
+    print_header("GATE DE REGRESSÃO DE PERFORMANCE")
+    
+    print("\n📏 Tempos em unidades de calibração (tempo do solver / tempo do laço de calibração)")
+    print(f"\n{'Solver':<20} {'Medido':<15} {'Linha de base':<20}")
+    print("─" * 55)
+    for solver, units in timings.items():
+        reference = f"{baseline[solver]:.2f}" if solver in baseline else "—"
+        print(f"{solver:<20} {units:<15.2f} {reference:<20}")
+    
+    if regressions:
+        print("\n❌ Regressões de performance detectadas:")
+        for regression in regressions:
+            print(f"  • {regression}")
+    else:
+        print("\n✅ Nenhuma regressão de performance!")
+
+
 def print_footer() -> None:
     """Imprime rodapé final."""
     print("\n" + "═" * 70 + "\n")
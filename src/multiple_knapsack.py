@@ -0,0 +1,319 @@
+"""
+Alocação Multi-Equipe (Mochila Múltipla 0/1)
+=============================================
+Distribui um único conjunto de projetos entre várias equipes, cada uma com
+sua própria capacidade de horas. Cada projeto é atribuído a no máximo uma
+equipe e o objetivo é maximizar o valor total do portfólio.
+
+Abordagem:
+    1. Heurística rápida: melhor encaixe por eficiência e, quando barato,
+       PD Bottom-Up equipe a equipe (solução inicial)
+    2. Branch-and-bound iterativo (pilha explícita): explora atribuições
+       projeto -> equipe, podando com o menor dos limitantes superiores:
+         - PD de mochila única com todas as equipes fundidas
+         - por equipe: soma, sobre as equipes, da PD de mochila única com a
+           capacidade restante de cada uma
+         - relaxação linear (fracionária) com todas as equipes fundidas
+    3. Limite de tempo contado desde a chamada: ao estourar, retorna a
+       melhor solução encontrada
+"""
+
+import time
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+from src.models import Project
+from src.algorithms import dynamic_programming_portfolio
+
+
+# Acima disso (projetos x capacidade) a tabela de limitantes por PD e a
+# heurística equipe a equipe ficam caras demais; usa apenas a relaxação linear
+MAX_BOUND_CELLS = 2_000_000
+
+# Frequência (em nós) da verificação do limite de tempo no branch-and-bound
+_DEADLINE_CHECK_INTERVAL = 1024
+
+
+def _best_fit(projects: List[Project], capacities: List[int]) -> List[int]:
+    """
+    Heurística O(n * m): aloca cada projeto (já ordenado por eficiência) na
+    equipe de menor capacidade restante onde ele ainda cabe.
+
+    Retorna:
+        Lista de atribuições: assignment[i] = índice da equipe do projeto i (-1 se não alocado)
+    """
+    remaining = list(capacities)
+    assignment = [-1] * len(projects)
+
+    for i, project in enumerate(projects):
+        best_team = -1
+        for team, cap in enumerate(remaining):
+            if project.hours <= cap and (best_team == -1 or cap < remaining[best_team]):
+                best_team = team
+        if best_team != -1:
+            assignment[i] = best_team
+            remaining[best_team] -= project.hours
+
+    return assignment
+
+
+def _greedy_team_by_team(projects: List[Project], capacities: List[int]) -> List[int]:
+    """
+    Heurística: resolve uma mochila 0/1 por equipe, da menor para a maior capacidade.
+
+    Args:
+        projects: Lista de projetos disponíveis
+        capacities: Capacidade de horas de cada equipe
+
+    Retorna:
+        Lista de atribuições: assignment[i] = índice da equipe do projeto i (-1 se não alocado)
+    """
+    assignment = [-1] * len(projects)
+    team_order = sorted(range(len(capacities)), key=lambda t: capacities[t])
+
+    for team in team_order:
+        remaining = [i for i in range(len(projects)) if assignment[i] == -1]
+        # Nomes podem se repetir; usa índices como nomes para retroação segura
+        candidates = [Project(name=str(i), value=projects[i].value, hours=projects[i].hours)
+                      for i in remaining]
+        _, chosen = dynamic_programming_portfolio(candidates, capacities[team])
+        for name in chosen:
+            assignment[int(name)] = team
+
+    return assignment
+
+
+def _suffix_bounds(projects: List[Project], width: int,
+                   deadline: Optional[float]) -> Optional[List[List[int]]]:
+    """
+    Constrói a tabela de limitantes superiores via PD sobre sufixos.
+
+    Estrutura da Tabela:
+        B[i][c] = valor máximo com projetos i..n-1 e uma única mochila de capacidade c
+
+    Limitantes válidos para capacidades restantes r_t das equipes:
+        - B[i][soma_t r_t]: toda alocação válida cabe em uma mochila com a soma
+        - soma_t B[i][r_t]: os conjuntos de cada equipe são disjuntos e cada um
+          cabe na capacidade restante da sua equipe
+
+    Retorna:
+        A tabela, ou None se o limite de tempo estourar durante a construção
+
+    Complexidade de Tempo: O(n * largura)
+    Complexidade de Espaço: O(n * largura)
+    """
+    n = len(projects)
+    B = [[0] * (width + 1) for _ in range(n + 1)]
+
+    for i in range(n - 1, -1, -1):
+        if deadline is not None and time.perf_counter() > deadline:
+            return None
+        hours = projects[i].hours
+        value = projects[i].value
+        below = B[i + 1]
+        row = B[i]
+        for c in range(width + 1):
+            best = below[c]
+            if hours <= c and value + below[c - hours] > best:
+                best = value + below[c - hours]
+            row[c] = best
+
+    return B
+
+
+def _assignment_value(projects: List[Project], assignment: List[int]) -> int:
+    """Soma o valor dos projetos alocados a alguma equipe."""
+    return sum(projects[i].value for i in range(len(projects)) if assignment[i] != -1)
+
+
+def multiple_knapsack_portfolio(projects: List[Project], capacities: List[int],
+                                time_limit: Optional[float] = None) -> Tuple[int, List[List[str]]]:
+    """
+    Mochila Múltipla 0/1: atribui cada projeto a no máximo uma equipe.
+
+    Substitui a execução sequencial de `dynamic_programming_portfolio` equipe a
+    equipe, que não garante solução ótima para o conjunto de equipes.
+
+    Algoritmo:
+        1. Descarta projetos com valor <= 0 e projetos que não cabem em nenhuma equipe
+        2. Ordena projetos por eficiência decrescente (melhora a poda e
+           permite a relaxação linear por somas prefixas)
+        3. Obtém solução inicial com as heurísticas
+        4. Branch-and-bound em profundidade com pilha explícita: para cada
+           projeto, tenta cada equipe onde ele cabe e, por último, não alocá-lo
+        5. Poda quando valor_atual + limitante <= melhor, com limitante =
+           min(B[i][soma_t r_t], soma_t B[i][r_t], relaxação linear com soma_t r_t)
+        6. Equipes com a mesma capacidade restante são equivalentes: apenas a
+           primeira é explorada (quebra de simetria)
+
+    Args:
+        projects: Lista de projetos disponíveis
+        capacities: Capacidade de horas de cada equipe
+        time_limit: Tempo máximo em segundos, contado desde a chamada (None = sem
+            limite). Ao estourar, retorna a melhor solução encontrada até o momento.
+
+    Retorna:
+        Tupla de (valor_total, selecionados_por_equipe), onde selecionados_por_equipe[t]
+        é a lista de nomes dos projetos atribuídos à equipe t
+
+    Complexidade de Tempo: O(n * capacidade_total) para os limitantes +
+        O((m+1)^n) no pior caso para o branch-and-bound (m = número de equipes)
+    Complexidade de Espaço: O(n * capacidade_total) - tabela de limitantes
+        (reduzida à maior capacidade, ou omitida, acima de MAX_BOUND_CELLS células)
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    if any(c < 0 for c in capacities):
+        raise ValueError("Capacidades das equipes não podem ser negativas")
+
+    num_teams = len(capacities)
+    if num_teams == 0:
+        return 0, []
+
+    max_capacity = max(capacities)
+    total_capacity = sum(capacities)
+
+    # Apenas projetos com valor positivo (os demais nunca melhoram uma solução)
+    # que cabem em alguma equipe, por eficiência decrescente (horas == 0
+    # primeiro: eficiência infinita)
+    order = [i for i in range(len(projects))
+             if projects[i].value > 0 and projects[i].hours <= max_capacity]
+    order.sort(key=lambda i: float('inf') if projects[i].hours == 0 else projects[i].efficiency(),
+               reverse=True)
+    items = [projects[i] for i in order]
+    n = len(items)
+
+    def _selections(assignment: List[int]) -> List[List[str]]:
+        """Converte atribuições em listas de nomes por equipe."""
+        selections: List[List[str]] = [[] for _ in range(num_teams)]
+        for i in range(n):
+            if assignment[i] != -1:
+                selections[assignment[i]].append(items[i].name)
+        return selections
+
+    # Solução inicial (heurísticas)
+    best_assignment = _best_fit(items, capacities)
+    best_value = _assignment_value(items, best_assignment)
+    if n * (total_capacity + 1) <= MAX_BOUND_CELLS:
+        candidate = _greedy_team_by_team(items, capacities)
+        candidate_value = _assignment_value(items, candidate)
+        if candidate_value > best_value:
+            best_assignment, best_value = candidate, candidate_value
+
+    # Limitantes: tabela de PD (até a capacidade total se couber, senão até a
+    # maior capacidade) e relaxação linear por somas prefixas
+    bounds = None
+    if n * (total_capacity + 1) <= MAX_BOUND_CELLS:
+        bound_width = total_capacity
+    elif n * (max_capacity + 1) <= MAX_BOUND_CELLS:
+        bound_width = max_capacity
+    else:
+        bound_width = -1
+    if bound_width >= 0:
+        bounds = _suffix_bounds(items, bound_width, deadline)
+        if bounds is None:
+            return best_value, _selections(best_assignment)
+
+    prefix_hours = [0] * (n + 1)
+    prefix_values = [0] * (n + 1)
+    for i, project in enumerate(items):
+        prefix_hours[i + 1] = prefix_hours[i] + project.hours
+        prefix_values[i + 1] = prefix_values[i] + project.value
+
+    remaining = list(capacities)
+    assignment = [-1] * n
+    value = 0
+    free_capacity = total_capacity
+
+    def _upper_bound(index: int) -> int:
+        """Maior valor que os projetos index..n-1 ainda podem somar."""
+        # Relaxação linear: projetos inteiros enquanto couberem, depois uma fração
+        target = prefix_hours[index] + free_capacity
+        k = bisect_right(prefix_hours, target, index) - 1
+        bound = prefix_values[k] - prefix_values[index]
+        if k < n:
+            bound += (target - prefix_hours[k]) * items[k].value // items[k].hours
+        if bounds is not None:
+            row = bounds[index]
+            # Todas as equipes fundidas em uma única mochila
+            if free_capacity <= bound_width:
+                bound = min(bound, row[free_capacity])
+            # Cada equipe com sua própria capacidade restante
+            bound = min(bound, sum(row[r] for r in remaining))
+        return bound
+
+    def _undo(index: int) -> None:
+        """Desfaz a atribuição do projeto `index`."""
+        nonlocal value, free_capacity
+        team = assignment[index]
+        if team != -1:
+            hours = items[index].hours
+            remaining[team] += hours
+            free_capacity += hours
+            value -= items[index].value
+            assignment[index] = -1
+
+    # choice[i]: próxima opção do projeto i (0..m-1 = equipe, m = não alocar, m+1 = esgotado)
+    choice = [0] * n
+    index = 0
+    arriving = True
+    nodes = 0
+
+    while True:
+        if arriving:
+            arriving = False
+            nodes += 1
+            if (deadline is not None and nodes % _DEADLINE_CHECK_INTERVAL == 0
+                    and time.perf_counter() > deadline):
+                break
+
+            if value > best_value:
+                best_value = value
+                best_assignment = assignment[:]
+
+            # Folha ou poda: volta ao projeto anterior
+            if index >= n or value + _upper_bound(index) <= best_value:
+                index -= 1
+                if index < 0:
+                    break
+                _undo(index)
+                continue
+            choice[index] = 0
+
+        project = items[index]
+        option = choice[index]
+
+        # Opções 0..m-1: atribui o projeto a uma equipe onde ele cabe
+        while option < num_teams:
+            team = option
+            option += 1
+            cap = remaining[team]
+            if project.hours > cap or cap in remaining[:team]:
+                continue
+            remaining[team] -= project.hours
+            free_capacity -= project.hours
+            value += project.value
+            assignment[index] = team
+            break
+        else:
+            team = -1
+
+        if team != -1:
+            choice[index] = option
+            index += 1
+            arriving = True
+            continue
+
+        # Opção m: não aloca o projeto
+        if option == num_teams:
+            choice[index] = num_teams + 1
+            index += 1
+            arriving = True
+            continue
+
+        # Opções esgotadas: volta ao projeto anterior
+        index -= 1
+        if index < 0:
+            break
+        _undo(index)
+
+    return best_value, _selections(best_assignment)
@@ -0,0 +1,236 @@
+"""
+PD Bottom-Up Paralela (Memória Compartilhada)
+==============================================
+Divide cada linha da tabela PD entre vários processos.
+
+Como T[i] depende apenas de T[i-1], o intervalo de capacidades de cada linha
+pode ser particionado entre os workers:
+    - Duas linhas (anterior/atual) ficam em `multiprocessing.shared_memory`,
+      acessadas sem cópia via `memoryview.cast('q')`
+    - Cada worker escreve sua fatia da linha atual e sincroniza em uma barreira
+    - As decisões (incluiu/não incluiu) são guardadas como bits, uma linha por
+      projeto, para o retrocesso no processo principal
+
+Fatias são alinhadas a múltiplos de 8 capacidades para que cada byte do
+bitset de decisões pertença a um único worker.
+"""
+
+import os
+import multiprocessing
+from multiprocessing.connection import wait
+from typing import List, Optional, Tuple
+from src.models import Project
+from src.algorithms import dynamic_programming_portfolio
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8: sem memória compartilhada, usa versão sequencial
+    shared_memory = None
+
+
+# Abaixo disso, o custo de criar processos supera o ganho
+MIN_CELLS_PER_WORKER = 50_000
+
+# Maior valor representável nas linhas compartilhadas (inteiros de 64 bits)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _fill_rows_worker(rows_name: str, decisions_name: str, capacity: int,
+                      hours: List[int], values: List[int], lo: int, hi: int,
+                      barrier) -> None:
+    """
+    Worker: preenche as colunas [lo, hi) de todas as linhas da tabela PD.
+
+    Args:
+        rows_name: Nome do bloco compartilhado com as duas linhas (2 * (capacidade+1) int64)
+        decisions_name: Nome do bloco compartilhado com o bitset de decisões (n linhas)
+        capacity: Capacidade total de horas
+        hours: Horas de cada projeto
+        values: Valor de cada projeto
+        lo: Primeira capacidade da fatia (múltiplo de 8)
+        hi: Capacidade final da fatia (exclusiva)
+        barrier: Barreira compartilhada entre todos os workers
+    """
+    width = capacity + 1
+    row_bytes = (width + 7) // 8
+    byte_lo = lo // 8
+    byte_hi = (hi + 7) // 8
+
+    rows_shm = decisions_shm = None
+    cells = decisions = None
+    try:
+        rows_shm = shared_memory.SharedMemory(name=rows_name)
+        decisions_shm = shared_memory.SharedMemory(name=decisions_name)
+        cells = rows_shm.buf.cast('q')
+        decisions = decisions_shm.buf
+
+        for i in range(len(hours)):
+            # Linhas alternam entre as duas metades do buffer
+            prev_base = (i % 2) * width
+            cur_base = ((i + 1) % 2) * width
+            prev = cells[prev_base:prev_base + width]
+            cur = cells[cur_base:cur_base + width]
+            h = hours[i]
+            v = values[i]
+            taken = bytearray(byte_hi - byte_lo)
+
+            # Capacidades menores que h: projeto não cabe, copia a linha anterior
+            split = min(max(h, lo), hi)
+            cur[lo:split] = prev[lo:split]
+
+            for c in range(split, hi):
+                exclude_value = prev[c]
+                include_value = v + prev[c - h]
+                if include_value > exclude_value:
+                    cur[c] = include_value
+                    taken[(c >> 3) - byte_lo] |= 1 << (c & 7)
+                else:
+                    cur[c] = exclude_value
+
+            base = i * row_bytes
+            decisions[base + byte_lo:base + byte_hi] = taken
+            prev.release()
+            cur.release()
+
+            # Todos terminam a linha i antes de alguém ler a linha i como anterior
+            barrier.wait()
+    except BaseException:
+        # Libera os demais workers presos na barreira
+        barrier.abort()
+        raise
+    finally:
+        if cells is not None:
+            cells.release()
+        decisions = None
+        for shm in (rows_shm, decisions_shm):
+            if shm is not None:
+                shm.close()
+
+
+def _join_workers(processes: List[multiprocessing.Process], barrier) -> None:
+    """
+    Aguarda todos os workers, interrompendo a PD se algum terminar com erro.
+
+    Um worker morto externamente (ex.: OOM killer) não chega a abortar a
+    barreira; os demais ficariam presos em `barrier.wait()` para sempre. Por
+    isso o processo principal observa os sentinelas de todos os workers e, ao
+    primeiro código de saída diferente de zero, aborta a barreira e encerra o resto.
+
+    Raises:
+        RuntimeError: Se algum worker terminar com código de saída diferente de zero
+    """
+    pending = {process.sentinel: process for process in processes}
+    while pending:
+        for sentinel in wait(list(pending)):
+            process = pending.pop(sentinel)
+            process.join()
+            if process.exitcode != 0:
+                barrier.abort()
+                for other in pending.values():
+                    other.terminate()
+                for other in pending.values():
+                    other.join()
+                raise RuntimeError(
+                    f"Falha em um worker da PD paralela (código de saída {process.exitcode})"
+                )
+
+
+def parallel_dynamic_programming_portfolio(projects: List[Project], capacity: int,
+                                           workers: Optional[int] = None,
+                                           min_cells: int = MIN_CELLS_PER_WORKER) -> Tuple[int, List[str]]:
+    """
+    PD Bottom-up com cada linha dividida entre processos.
+
+    Mesma recorrência de `dynamic_programming_portfolio`, mas as capacidades
+    0..capacidade de cada linha são particionadas entre `workers` processos que
+    compartilham as linhas T[i-1] e T[i] sem cópia. Indicada para capacidades
+    muito grandes (ex.: 10^7), onde a versão sequencial usa apenas um núcleo.
+
+    Retorna à versão sequencial quando:
+        - `multiprocessing.shared_memory` não está disponível (Python < 3.8)
+        - a capacidade é pequena demais para compensar a criação de processos
+        - a soma dos valores não cabe em inteiros de 64 bits
+
+    Args:
+        projects: Lista de projetos disponíveis
+        capacity: Máximo de horas de especialista disponíveis
+        workers: Número de processos (padrão: os.cpu_count())
+        min_cells: Mínimo de capacidades por worker; com 1, força o caminho
+            paralelo mesmo em entradas pequenas (usado na verificação diferencial)
+
+    Retorna:
+        Tupla de (valor_ótimo, nomes_projetos_selecionados)
+
+    Complexidade de Tempo: O(n * capacidade / workers) + n barreiras
+    Complexidade de Espaço: O(capacidade) para as linhas + O(n * capacidade / 8) bytes de decisões
+    """
+    n = len(projects)
+    width = capacity + 1
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, width // max(min_cells, 1))
+
+    if (shared_memory is None or workers <= 1 or n == 0
+            or sum(max(p.value, 0) for p in projects) > _INT64_MAX):
+        return dynamic_programming_portfolio(projects, capacity)
+
+    hours = [p.hours for p in projects]
+    values = [p.value for p in projects]
+    row_bytes = (width + 7) // 8
+
+    rows_shm = shared_memory.SharedMemory(create=True, size=2 * width * 8)
+    decisions_shm = shared_memory.SharedMemory(create=True, size=n * row_bytes)
+    try:
+        # Linha T[0] = 0 (sem projetos = valor zero)
+        cells = rows_shm.buf.cast('q')
+        cells[0:width] = memoryview(bytes(width * 8)).cast('q')
+        cells.release()
+
+        # Partição por bytes do bitset: fatias alinhadas a 8 capacidades
+        barrier = multiprocessing.Barrier(workers)
+        processes = []
+        try:
+            for w in range(workers):
+                byte_lo = row_bytes * w // workers
+                byte_hi = row_bytes * (w + 1) // workers
+                lo = byte_lo * 8
+                hi = min(byte_hi * 8, width)
+                process = multiprocessing.Process(
+                    target=_fill_rows_worker,
+                    args=(rows_shm.name, decisions_shm.name, capacity,
+                          hours, values, lo, hi, barrier),
+                )
+                process.start()
+                processes.append(process)
+
+            _join_workers(processes, barrier)
+        finally:
+            # Em qualquer falha no processo principal, nenhum worker sobrevive
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+        # Valor ótimo está em T[n][capacidade]
+        cells = rows_shm.buf.cast('q')
+        optimal_value = cells[(n % 2) * width + capacity]
+        cells.release()
+
+        # Retroage pelo bitset de decisões
+        decisions = decisions_shm.buf
+        selected_projects = []
+        c = capacity
+        for i in range(n - 1, -1, -1):
+            if decisions[i * row_bytes + (c >> 3)] >> (c & 7) & 1:
+                selected_projects.append(projects[i].name)
+                c -= hours[i]
+        del decisions
+        selected_projects.reverse()
+    finally:
+        rows_shm.close()
+        rows_shm.unlink()
+        decisions_shm.close()
+        decisions_shm.unlink()
+
+    return optimal_value, selected_projects
@@ -4,14 +4,16 @@ Executor de Testes para Otimização de Portfólio
 Orquestra a execução de testes e exibição de resultados.
 """
 
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 from src.algorithms import (
     greedy_portfolio,
     recursive_portfolio,
-    memoization_portfolio,
-    dynamic_programming_portfolio
+    memoization_portfolio
 )
+from src.bitset_dp import bitset_portfolio, is_subset_sum_portfolio
 from src.utils import calculate_hours_used
+from src.exporter import ResultWriter
 from src.formatter import (
     print_test_case_header,
     print_input_section,
@@ -23,6 +25,71 @@ from src.formatter import (
 )
 
 
+def solve_test_case(test_case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Executa um único caso de teste através dos quatro algoritmos, sem saída no console.
+    
+    Args:
+        test_case: Dicionário contendo dados do caso de teste (ver run_test_case)
+            
+    Retorna:
+        Dicionário com valores, seleções e tempos (em segundos) de cada algoritmo:
+            - greedy, recursive, memoization, dp: valores obtidos
+              (recursive é None quando pulada)
+            - greedy_projects, dp_projects: projetos selecionados
+            - memo_size: tamanho do dicionário memo
+            - *_seconds: tempo de execução de cada algoritmo
+            - dp_engine: motor usado na Fase 4 ("bitset" quando valor == horas,
+              senão "dp")
+    """
+    capacity = test_case['capacity']
+    projects = test_case['projects']
+    
+    # Phase 1: Greedy
+    start = time.perf_counter()
+    greedy_value, greedy_projects = greedy_portfolio(projects, capacity)
+    greedy_seconds = time.perf_counter() - start
+    
+    # Phase 2: Pure Recursive (skip if too many projects)
+    if len(projects) <= 10:
+        start = time.perf_counter()
+        recursive_value = recursive_portfolio(projects, capacity)
+        recursive_seconds = time.perf_counter() - start
+    else:
+        recursive_value = None
+        recursive_seconds = None
+    
+    # Phase 3: Memoization
+    start = time.perf_counter()
+    memo_value, memo_dict = memoization_portfolio(projects, capacity)
+    memo_seconds = time.perf_counter() - start
+    
+    # Phase 4: Bottom-Up DP (bitset fast path when value == hours)
+    start = time.perf_counter()
+    dp_value, dp_projects = bitset_portfolio(projects, capacity)
+    dp_seconds = time.perf_counter() - start
+    dp_engine = 'bitset' if is_subset_sum_portfolio(projects) else 'dp'
+    
+    return {
+        'case_num': test_case['case_num'],
+        'name': test_case['name'],
+        'capacity': capacity,
+        'num_projects': len(projects),
+        'greedy': greedy_value,
+        'greedy_projects': greedy_projects,
+        'greedy_seconds': greedy_seconds,
+        'recursive': recursive_value,
+        'recursive_seconds': recursive_seconds,
+        'memoization': memo_value,
+        'memo_size': len(memo_dict),
+        'memoization_seconds': memo_seconds,
+        'dp': dp_value,
+        'dp_projects': dp_projects,
+        'dp_seconds': dp_seconds,
+        'dp_engine': dp_engine,
+    }
+
+
 def run_test_case(test_case: Dict[str, Any]) -> Dict[str, int]:
     """
     Executa um único caso de teste através dos quatro algoritmos.
@@ -48,8 +115,14 @@ def run_test_case(test_case: Dict[str, Any]) -> Dict[str, int]:
     print_test_case_header(case_num, name)
     print_input_section(capacity, projects)
     
+    record = solve_test_case(test_case)
+    greedy_value = record['greedy']
+    recursive_value = record['recursive']
+    memo_value = record['memoization']
+    dp_value = record['dp']
+    
     # Phase 1: Greedy
-    greedy_value, greedy_projects = greedy_portfolio(projects, capacity)
+    greedy_projects = record['greedy_projects']
     greedy_hours = calculate_hours_used(projects, greedy_projects)
     greedy_results = {
         'value': greedy_value,
@@ -59,30 +132,26 @@ def run_test_case(test_case: Dict[str, Any]) -> Dict[str, int]:
     }
     print_phase_results(1, "ESTRATÉGIA GULOSA", greedy_results)
     
-    # Phase 2: Pure Recursive (skip if too many projects)
-    if len(projects) <= 10:
-        recursive_value = recursive_portfolio(projects, capacity)
+    # Phase 2: Pure Recursive
+    if recursive_value is not None:
         recursive_results = {
             'value': recursive_value,
             'complexity': "O(2^n) - Exponencial"
         }
-        print_phase_results(2, "SOLUÇÃO RECURSIVA PURA", recursive_results)
     else:
-        recursive_value = None
         recursive_results = {'skipped': True}
-        print_phase_results(2, "SOLUÇÃO RECURSIVA PURA", recursive_results)
+    print_phase_results(2, "SOLUÇÃO RECURSIVA PURA", recursive_results)
     
     # Phase 3: Memoization
-    memo_value, memo_dict = memoization_portfolio(projects, capacity)
     memo_results = {
         'value': memo_value,
-        'memo_size': len(memo_dict),
+        'memo_size': record['memo_size'],
         'complexity': "O(n × capacidade)"
     }
     print_phase_results(3, "PROGRAMAÇÃO DINÂMICA (Top-Down com Memoização)", memo_results)
     
     # Phase 4: Bottom-Up DP
-    dp_value, dp_projects = dynamic_programming_portfolio(projects, capacity)
+    dp_projects = record['dp_projects']
     dp_hours = calculate_hours_used(projects, dp_projects)
     dp_results = {
         'value': dp_value,
@@ -107,18 +176,32 @@ def run_test_case(test_case: Dict[str, Any]) -> Dict[str, int]:
     }
 
 
-def run_all_tests(test_cases: List[Dict[str, Any]]) -> List[Dict[str, int]]:
+def run_all_tests(test_cases: List[Dict[str, Any]],
+                  writer: Optional[ResultWriter] = None) -> List[Dict[str, Any]]:
     """
     Executa todos os casos de teste e exibe resumo.
     
+    Com um `writer` (modo headless), nenhuma saída formatada é impressa:
+    cada resultado é gravado no writer assim que o caso termina.
+    
     Args:
         test_cases: Lista de dicionários de casos de teste
+        writer: Destino dos resultados em modo headless (None = saída formatada)
         
     Retorna:
         Lista de dicionários de resultados de todos os casos de teste
+        (em modo headless, os registros completos de solve_test_case)
     """
     all_results = []
     
+    # Headless: no console formatting, stream records to the writer
+    if writer is not None:
+        for test_case in test_cases:
+            record = solve_test_case(test_case)
+            writer.write(record)
+            all_results.append(record)
+        return all_results
+    
     # Run each test case
     for test_case in test_cases:
         results = run_test_case(test_case)